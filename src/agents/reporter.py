@@ -7,10 +7,26 @@ Responsibilities:
 - Format structured JSON output.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np  # optional, used to vectorize large candidate pools
+except ImportError:
+    np = None  # type: ignore[assignment]
 
 from src.utilis.logger import logger
 
+# Highest confidence the formula can produce: the best credibility rule
+# scores 0.9, so 0.9*0.5 + 1.0*0.3 + 1.0*0.2 = 0.95. Once a candidate
+# reaches this there is no point scoring the rest.
+_CONFIDENCE_SATURATION = 0.95
+
+# (source_credibility, cross_engine, designation_match) weights
+_CONFIDENCE_WEIGHTS = (0.5, 0.3, 0.2)
+
+# Below this many candidates the scalar scan beats NumPy's setup cost
+_VECTORIZE_MIN_CANDIDATES = 32
+
 
 def _calculate_confidence(candidate: Dict[str, Any]) -> float:
     """Calculate the composite confidence score for a candidate.
@@ -38,6 +54,46 @@ def _calculate_confidence(candidate: Dict[str, Any]) -> float:
     return round(min(max(confidence, 0.0), 1.0), 4)
 
 
+def _select_best(candidates: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], float]:
+    """Return the highest-confidence candidate and its score.
+
+    Large pools are scored as one NumPy matrix product (structure-of-arrays
+    plus argmax, O(N) with no Python-level float math); small pools use a
+    scalar scan with an early exit at the confidence ceiling.
+
+    Args:
+        candidates: Non-empty list of validated candidate dicts.
+
+    Returns:
+        Tuple of (best candidate, rounded confidence score).
+    """
+    if np is not None and len(candidates) >= _VECTORIZE_MIN_CANDIDATES:
+        arr = np.array(
+            [
+                (
+                    c.get("source_credibility", 0.6),
+                    1.0 if c.get("cross_engine_validated", False) else 0.0,
+                    c.get("designation_match_score", 0.0),
+                )
+                for c in candidates
+            ],
+            dtype=np.float32,
+        )
+        conf = np.clip(arr @ np.array(_CONFIDENCE_WEIGHTS, dtype=np.float32), 0.0, 1.0)
+        idx = int(conf.argmax())
+        return candidates[idx], round(float(conf[idx]), 4)
+
+    best = candidates[0]
+    best_conf = _calculate_confidence(best)
+    for c in candidates[1:]:
+        if best_conf >= _CONFIDENCE_SATURATION:
+            break
+        conf = _calculate_confidence(c)
+        if conf > best_conf:
+            best, best_conf = c, conf
+    return best, best_conf
+
+
 def run_reporter(state: Dict[str, Any]) -> Dict[str, Any]:
     """Reporter node: select best candidate and format output.
 
@@ -52,23 +108,14 @@ def run_reporter(state: Dict[str, Any]) -> Dict[str, Any]:
     if not candidates:
         logger.warning("Reporter: no validated candidates found")
         return {
-            **state,
             "final_output": {
                 "error": "No verified results found",
                 "confidence_score": 0.0,
             },
         }
 
-    # Score all candidates
-    scored: List[Dict[str, Any]] = []
-    for c in candidates:
-        conf = _calculate_confidence(c)
-        scored.append({**c, "confidence_score": conf})
-
-    # Sort descending by confidence
-    scored.sort(key=lambda x: x["confidence_score"], reverse=True)
-
-    best = scored[0]
+    best, best_conf = _select_best(candidates)
+    best = {**best, "confidence_score": best_conf}
     logger.info(
         "Reporter selected: %s %s (confidence=%.4f)",
         best.get("first_name", ""),
@@ -87,7 +134,7 @@ def run_reporter(state: Dict[str, Any]) -> Dict[str, Any]:
 
     logger.info("Final confidence score: %.4f", final_output["confidence_score"])
 
+    # Partial update — LangGraph merges changed keys into the state
     return {
-        **state,
         "final_output": final_output,
     }
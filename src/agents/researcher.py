@@ -7,13 +7,10 @@ Responsibilities:
 - Merge and deduplicate results.
 """
 
-from typing import Any, Dict, List
+import functools
+from typing import Any, Dict, List, Tuple
 
-from src.tools.search_tools import (
-    duckduckgo_search,
-    merge_and_deduplicate,
-    serpapi_search,
-)
+from src.tools.search_tools import merge_and_deduplicate, run_searches
 from src.utilis.logger import logger
 
 # ---------------------------------------------------------------------------
@@ -42,21 +39,25 @@ DESIGNATION_ALIASES: Dict[str, List[str]] = {
 }
 
 
-def _expand_designation(designation: str) -> List[str]:
-    """Return a list of alternative forms for the given designation.
+@functools.lru_cache(maxsize=128)
+def _expand_designation(designation: str) -> Tuple[str, ...]:
+    """Return alternative forms for the given designation.
+
+    Pure string → variants lookup, so results are memoized across calls
+    (the retry loop and repeat searches hit the same designations).
 
     Args:
         designation: Raw designation string supplied by user.
 
     Returns:
-        List of designation variants (always includes original).
+        Tuple of designation variants (always includes original).
     """
     key = designation.strip().lower()
     variants = DESIGNATION_ALIASES.get(key, [])
     # Always keep the original
     if designation not in variants:
         variants = [designation] + variants
-    return variants
+    return tuple(variants)
 
 
 def generate_queries(company: str, designation: str) -> List[str]:
@@ -70,21 +71,22 @@ def generate_queries(company: str, designation: str) -> List[str]:
         List of search query strings.
     """
     variants = _expand_designation(designation)
-    queries: List[str] = []
-
-    for variant in variants:
-        queries.append(f"{company} {variant}")
-        queries.append(f"Who is the {variant} of {company}")
-        queries.append(f"{company} {variant} LinkedIn")
-
-    # Deduplicate while preserving order
-    seen: set = set()
-    unique: List[str] = []
+    queries = [
+        template.format(company=company, variant=variant)
+        for variant in variants
+        for template in (
+            "{company} {variant}",
+            "Who is the {variant} of {company}",
+            "{company} {variant} LinkedIn",
+        )
+    ]
+
+    # Deduplicate case-insensitively in one pass, keeping first casing
+    # and insertion order (dict preserves it).
+    seen: Dict[str, str] = {}
     for q in queries:
-        q_lower = q.lower()
-        if q_lower not in seen:
-            seen.add(q_lower)
-            unique.append(q)
+        seen.setdefault(q.lower(), q)
+    unique = list(seen.values())
 
     logger.info("Generated %d queries for company=%s designation=%s", len(unique), company, designation)
     return unique
@@ -105,14 +107,11 @@ def run_researcher(state: Dict[str, Any]) -> Dict[str, Any]:
     # 1. Generate queries
     queries = generate_queries(company, designation)
 
-    # 2. Execute searches (use first few queries to stay within rate limits)
+    # 2. Execute searches (use first few queries to stay within rate limits).
+    # Both engines are queried concurrently so wall time is bounded by the
+    # slowest single request rather than the sum of all round-trips.
     max_queries = min(len(queries), 4)
-    all_serp: List[Dict[str, Any]] = []
-    all_ddg: List[Dict[str, Any]] = []
-
-    for query in queries[:max_queries]:
-        all_serp.extend(serpapi_search(query, num_results=5))
-        all_ddg.extend(duckduckgo_search(query, num_results=5))
+    all_serp, all_ddg = run_searches(queries[:max_queries], num_results=5)
 
     # 3. Merge & deduplicate
     merged = merge_and_deduplicate(all_serp, all_ddg)
@@ -122,8 +121,9 @@ def run_researcher(state: Dict[str, Any]) -> Dict[str, Any]:
         len(all_serp), len(all_ddg), len(merged),
     )
 
+    # Partial update — LangGraph merges changed keys into the state,
+    # so there is no need to copy the whole dict here.
     return {
-        **state,
         "queries": queries,
         "serp_results": all_serp,
         "ddg_results": all_ddg,
@@ -8,15 +8,23 @@ Responsibilities:
 - Score source credibility and designation match.
 """
 
+import functools
+import itertools
 import os
 import re
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from src.tools.search_tools import scrape_page
+try:
+    import hyperscan  # optional vectorized regex scanner
+except ImportError:
+    hyperscan = None  # type: ignore[assignment]
+
+from src.tools.search_tools import hash_key, scrape_pages
 from src.utilis.logger import logger
 
 load_dotenv()
@@ -32,6 +40,16 @@ CREDIBILITY_RULES: List[Dict[str, Any]] = [
 ]
 DEFAULT_CREDIBILITY = 0.6
 
+# All rules compiled into one alternation so scoring a URL is a single
+# C-level scan; each match's named group indexes back into the rule list,
+# and the lowest-indexed rule seen anywhere in the URL wins so list order
+# keeps its priority semantics.
+_CREDIBILITY_RE = re.compile(
+    "|".join(f"(?P<g{i}>{rule['pattern']})" for i, rule in enumerate(CREDIBILITY_RULES)),
+    re.IGNORECASE,
+)
+_CREDIBILITY_SCORES = [rule["score"] for rule in CREDIBILITY_RULES]
+
 
 def _score_source(url: str) -> float:
     """Return a credibility score for the given URL.
@@ -42,10 +60,15 @@ def _score_source(url: str) -> float:
     Returns:
         Float credibility score between 0 and 1.
     """
-    url_lower = url.lower()
-    for rule in CREDIBILITY_RULES:
-        if re.search(rule["pattern"], url_lower):
-            return rule["score"]
+    best_idx: Optional[int] = None
+    for match in _CREDIBILITY_RE.finditer(url):
+        idx = int(match.lastgroup[1:])
+        if best_idx is None or idx < best_idx:
+            best_idx = idx
+            if best_idx == 0:
+                break
+    if best_idx is not None:
+        return _CREDIBILITY_SCORES[best_idx]
     return DEFAULT_CREDIBILITY
 
 
@@ -56,33 +79,82 @@ _NAME_PATTERN = re.compile(
     r"\b([A-Z][a-z]{1,20}(?:\s[A-Z]\.?)?\s[A-Z][a-z]{1,20}(?:-[A-Z][a-z]{1,20})?)\b"
 )
 
-# Common false-positive words to filter out
-_FALSE_POSITIVES = {
-    "The Company", "Our Team", "Read More", "Learn More", "Sign In",
-    "Sign Up", "Contact Us", "Privacy Policy", "Terms Service",
-    "All Rights", "New York", "San Francisco", "Los Angeles",
-    "United States", "United Kingdom", "Hong Kong", "Last Updated",
-    "About Us", "See Also", "Click Here", "Find Out",
-}
+# Hyperscan compiles the same pattern into a vectorized DFA — much faster
+# than Python's backtracking engine over large page bodies. Built once at
+# import; scanning falls back to the Python regex when unavailable.
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[_NAME_PATTERN.pattern.encode()],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8],
+        )
+    except Exception as exc:
+        logger.warning("Hyperscan compile failed, using Python regex: %s", exc)
+        _HS_DB = None
+
+
+def _iter_name_matches(text: str) -> List[str]:
+    """Yield raw name-pattern matches from *text*.
+
+    Uses the Hyperscan DFA when installed, otherwise the compiled
+    Python regex.
+    """
+    if _HS_DB is not None:
+        data = text.encode("utf-8")
+        spans: List[tuple] = []
+        _HS_DB.scan(
+            data,
+            match_event_handler=lambda _id, start, end, _flags, _ctx: spans.append(
+                (start, end)
+            ),
+        )
+        return [data[start:end].decode("utf-8", "ignore") for start, end in spans]
+    return [m.group(1) for m in _NAME_PATTERN.finditer(text)]
+
+# Common false-positive words to filter out (lowercased for casefold lookup)
+_FALSE_POSITIVES = frozenset(
+    s.lower()
+    for s in {
+        "The Company", "Our Team", "Read More", "Learn More", "Sign In",
+        "Sign Up", "Contact Us", "Privacy Policy", "Terms Service",
+        "All Rights", "New York", "San Francisco", "Los Angeles",
+        "United States", "United Kingdom", "Hong Kong", "Last Updated",
+        "About Us", "See Also", "Click Here", "Find Out",
+    }
+)
+
+
+# Downstream validation only ever needs a handful of names, so stop
+# scanning once a page has produced this many distinct candidates.
+_MAX_NAMES_PER_PAGE = 50
 
 
 def _extract_names_regex(text: str) -> List[str]:
     """Extract potential person names from text with regex.
 
+    Matches are streamed (no upfront findall list) and extraction stops
+    early once _MAX_NAMES_PER_PAGE distinct names have been collected.
+
     Args:
         text: Raw text body.
 
     Returns:
         Deduplicated list of name strings.
     """
-    matches = _NAME_PATTERN.findall(text)
     names: List[str] = []
     seen: set = set()
-    for m in matches:
+    for m in _iter_name_matches(text):
         m_clean = m.strip()
-        if m_clean not in seen and m_clean not in _FALSE_POSITIVES and len(m_clean) > 3:
-            seen.add(m_clean)
+        key = m_clean.lower()
+        key_hash = hash_key(key)
+        if key_hash not in seen and key not in _FALSE_POSITIVES and len(m_clean) > 3:
+            seen.add(key_hash)
             names.append(m_clean)
+            if len(names) >= _MAX_NAMES_PER_PAGE:
+                break
     return names
 
 
@@ -90,8 +162,9 @@ def _extract_names_regex(text: str) -> List[str]:
 # LLM-based name extraction via Groq
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def _get_llm() -> ChatGroq:
-    """Instantiate and return the Groq LLM client."""
+    """Return the Groq LLM client (constructed once and reused)."""
     api_key = os.getenv("GROQ_API_KEY", "") or os.getenv("GROQ_API_KEY_1", "")
     return ChatGroq(
         model="llama-3.1-8b-instant",
@@ -100,21 +173,36 @@ def _get_llm() -> ChatGroq:
     )
 
 
-def _extract_names_llm(
-    text: str, company: str, designation: str
-) -> List[str]:
-    """Use Groq LLM to extract person names matching the designation.
+def _parse_llm_names(raw: str) -> List[str]:
+    """Parse an LLM name-extraction reply into a list of names."""
+    raw = raw.strip()
+    if raw.upper() == "NONE" or not raw:
+        return []
+    return [n.strip() for n in raw.splitlines() if n.strip() and n.strip().upper() != "NONE"]
+
+
+def _extract_names_llm_batch(
+    texts: List[str], company: str, designation: str
+) -> List[List[str]]:
+    """Use Groq LLM to extract person names from several texts in one batch.
+
+    All per-text prompts are submitted via ``llm.batch`` so the API
+    round-trips overlap instead of running one after another.
 
     Args:
-        text: Page/snippet text.
+        texts: Page/snippet texts, one entry per search result.
         company: Target company.
         designation: Target designation.
 
     Returns:
-        List of extracted name strings.
+        A list of name lists, aligned with *texts* (empty list per text
+        on failure or no match).
     """
-    if not text.strip():
-        return []
+    # Only pay for texts that actually carry content
+    indexed = [(i, t) for i, t in enumerate(texts) if t.strip()]
+    names_per_text: List[List[str]] = [[] for _ in texts]
+    if not indexed:
+        return names_per_text
 
     llm = _get_llm()
 
@@ -124,66 +212,82 @@ def _extract_names_llm(
         "at the given company. Return names one per line, nothing else. "
         "If no relevant name is found, return NONE."
     )
-    user_prompt = (
-        f"Company: {company}\n"
-        f"Designation: {designation}\n\n"
-        f"Text:\n{text[:3000]}\n\n"
-        "Extract the full name(s) of the person(s) who hold the above designation "
-        "at the above company. Return names only, one per line."
-    )
+    batched_messages = [
+        [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=(
+                f"Company: {company}\n"
+                f"Designation: {designation}\n\n"
+                f"Text:\n{text[:3000]}\n\n"
+                "Extract the full name(s) of the person(s) who hold the above designation "
+                "at the above company. Return names only, one per line."
+            )),
+        ]
+        for _, text in indexed
+    ]
 
     try:
-        response = llm.invoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt),
-        ])
-        raw = response.content.strip()
-        if raw.upper() == "NONE" or not raw:
-            return []
+        responses = llm.batch(batched_messages, return_exceptions=True)
+    except Exception as exc:
+        logger.error("LLM batch extraction failed: %s", exc)
+        return names_per_text
 
-        names = [n.strip() for n in raw.splitlines() if n.strip() and n.strip().upper() != "NONE"]
-        logger.info("LLM extracted names: %s", names)
-        return names
+    for (i, _), response in zip(indexed, responses):
+        if isinstance(response, Exception):
+            logger.error("LLM extraction failed for text %d: %s", i, response)
+            continue
+        names = _parse_llm_names(response.content)
+        if names:
+            logger.info("LLM extracted names: %s", names)
+        names_per_text[i] = names
 
-    except Exception as exc:
-        logger.error("LLM extraction failed: %s", exc)
-        return []
+    return names_per_text
 
 
-def _validate_designation_llm(
-    name: str, company: str, designation: str, snippet: str
-) -> float:
-    """Ask the LLM to confirm the designation match and return a score.
+def _validate_designations_llm_batch(
+    pairs: List[Dict[str, str]], company: str, designation: str
+) -> List[float]:
+    """Score designation matches for several candidates in one LLM batch.
 
     Args:
-        name: Candidate name.
+        pairs: Dicts with 'name' and 'snippet' keys, one per candidate.
         company: Target company.
         designation: Target designation.
-        snippet: Supporting text snippet.
 
     Returns:
-        Float between 0.0 and 1.0 indicating designation match confidence.
+        Confidence floats between 0.0 and 1.0, aligned with *pairs*.
     """
+    if not pairs:
+        return []
+
     llm = _get_llm()
 
-    prompt = (
-        f"Is '{name}' the '{designation}' of '{company}'?\n"
-        f"Supporting text: {snippet[:1500]}\n\n"
-        "Reply with a single number between 0.0 and 1.0 representing your confidence. "
-        "0.0 = definitely not, 1.0 = definitely yes. Reply with the number ONLY."
-    )
+    batched_messages = [
+        [HumanMessage(content=(
+            f"Is '{p['name']}' the '{designation}' of '{company}'?\n"
+            f"Supporting text: {p['snippet'][:1500]}\n\n"
+            "Reply with a single number between 0.0 and 1.0 representing your confidence. "
+            "0.0 = definitely not, 1.0 = definitely yes. Reply with the number ONLY."
+        ))]
+        for p in pairs
+    ]
 
     try:
-        response = llm.invoke([HumanMessage(content=prompt)])
-        score_str = response.content.strip()
-        # Extract first float-like value from response
-        match = re.search(r"(\d+\.?\d*)", score_str)
-        if match:
-            return min(float(match.group(1)), 1.0)
-        return 0.5
+        responses = llm.batch(batched_messages, return_exceptions=True)
     except Exception as exc:
-        logger.warning("Designation validation LLM call failed: %s", exc)
-        return 0.5
+        logger.warning("Designation validation LLM batch failed: %s", exc)
+        return [0.5] * len(pairs)
+
+    scores: List[float] = []
+    for response in responses:
+        if isinstance(response, Exception):
+            logger.warning("Designation validation LLM call failed: %s", response)
+            scores.append(0.5)
+            continue
+        # Extract first float-like value from response
+        match = re.search(r"(\d+\.?\d*)", response.content.strip())
+        scores.append(min(float(match.group(1)), 1.0) if match else 0.5)
+    return scores
 
 
 # ---------------------------------------------------------------------------
@@ -192,34 +296,31 @@ def _validate_designation_llm(
 
 def _cross_validate(
     candidates: List[Dict[str, Any]],
+    extra_engines: Optional[Dict[str, set]] = None,
 ) -> List[Dict[str, Any]]:
     """Cross-validate candidate names across sources.
 
     A name appearing in results from both search engines gets a boost.
+    One pass builds a name → engines map, so the per-candidate check is
+    a single set-size comparison instead of a scan over every engine.
 
     Args:
         candidates: Raw candidate dicts with 'full_name' and 'source_engine'.
+        extra_engines: Optional name-key → engine sets observed for names
+            that already had a candidate record (duplicate sightings).
 
     Returns:
         Candidates annotated with 'cross_engine_validated' flag.
     """
-    # Build sets of names per engine
-    engine_names: Dict[str, set] = {}
+    name_engines: Dict[str, set] = defaultdict(set)
     for c in candidates:
-        eng = c.get("source_engine", "unknown")
-        engine_names.setdefault(eng, set()).add(c["full_name"].lower())
-
-    engines = list(engine_names.keys())
+        name_engines[c["full_name"].lower()].add(c.get("source_engine", "unknown"))
+    if extra_engines:
+        for key, engines in extra_engines.items():
+            name_engines[key] |= engines
 
     for c in candidates:
-        name_lower = c["full_name"].lower()
-        # Check if name appears in any other engine
-        validated = any(
-            name_lower in engine_names.get(eng, set())
-            for eng in engines
-            if eng != c.get("source_engine", "")
-        )
-        c["cross_engine_validated"] = validated
+        c["cross_engine_validated"] = len(name_engines[c["full_name"].lower()]) > 1
 
     cross_count = sum(1 for c in candidates if c.get("cross_engine_validated"))
     logger.info("Cross-validation: %d / %d candidates cross-engine validated", cross_count, len(candidates))
@@ -245,56 +346,51 @@ def run_validator(state: Dict[str, Any]) -> Dict[str, Any]:
 
     # ---- Hard limit on how many pages we scrape ----
     MAX_SCRAPE_PAGES = 10
-    scrape_count = 0
 
     candidates: List[Dict[str, Any]] = []
-    seen_names: set = set()
+    # O(1) index from normalized name to its candidate record
+    name_to_candidate: Dict[str, Dict[str, Any]] = {}
+    # Engines for names sighted again after their candidate was recorded
+    extra_engines: Dict[str, set] = defaultdict(set)
+
+    # Scrape the top pages concurrently — each fetch is independent and
+    # network-bound, so overlapping them all up front hides the HTTP latency.
+    urls = [r["link"] for r in merged[:MAX_SCRAPE_PAGES] if r.get("link")]
+    page_texts = scrape_pages(urls)
+    if page_texts:
+        logger.info("Scraped %d pages concurrently", len(page_texts))
 
     # Process top results (capped to avoid excessive scraping)
-    for result in merged[:15]:
-        url = result.get("link", "")
-        snippet = result.get("snippet", "")
-        title = result.get("title", "")
-        source_engine = result.get("source_engine", "unknown")
-        combined_text = f"{title} {snippet}"
+    top_results = merged[:15]
+    full_texts = [
+        f"{r.get('title', '')} {r.get('snippet', '')} {page_texts.get(r.get('link', ''), '')}"
+        for r in top_results
+    ]
 
-        # Only scrape if under the limit
-        if url and scrape_count < MAX_SCRAPE_PAGES:
-            page_text = scrape_page(url)
-            scrape_count += 1
-            logger.info("Scraped %d / %d pages", scrape_count, MAX_SCRAPE_PAGES)
-        else:
-            page_text = ""
-            if scrape_count >= MAX_SCRAPE_PAGES:
-                logger.info("Scrape limit reached (%d) — using snippet only for %s", MAX_SCRAPE_PAGES, url)
+    # --- LLM extraction (one batched request covers all results) ---
+    llm_names_per_result = _extract_names_llm_batch(full_texts, company, designation)
 
-        full_text = f"{combined_text} {page_text}"
+    for result, full_text, llm_names in zip(top_results, full_texts, llm_names_per_result):
+        url = result.get("link", "")
+        source_engine = result.get("source_engine", "unknown")
 
         # --- Regex extraction ---
         regex_names = _extract_names_regex(full_text)
 
-        # --- LLM extraction ---
-        llm_names = _extract_names_llm(full_text, company, designation)
-
-        # Combine both extraction methods
-        all_names = list(set(regex_names + llm_names))
-
-        for name in all_names:
+        # Merge both extraction methods lazily — name_to_candidate already
+        # dedupes, so no intermediate concat list or set is needed.
+        for name in itertools.chain(regex_names, llm_names):
             name_key = name.lower().strip()
-            if name_key in seen_names:
-                # Update existing candidate if found in another engine
-                for c in candidates:
-                    if c["full_name"].lower() == name_key:
-                        if source_engine != c.get("source_engine"):
-                            c["cross_engine_validated"] = True
+            if name_key in name_to_candidate:
+                # Remember the engine; _cross_validate folds this in later
+                extra_engines[name_key].add(source_engine)
                 continue
 
-            seen_names.add(name_key)
             parts = name.strip().split()
             first_name = parts[0] if parts else ""
             last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
 
-            candidates.append({
+            name_to_candidate[name_key] = candidate = {
                 "first_name": first_name,
                 "last_name": last_name,
                 "full_name": name.strip(),
@@ -305,24 +401,50 @@ def run_validator(state: Dict[str, Any]) -> Dict[str, Any]:
                 "source_credibility": _score_source(url),
                 "cross_engine_validated": False,
                 "designation_match_score": 0.0,
-            })
+            }
+            candidates.append(candidate)
 
     # Cross-validate across engines
-    candidates = _cross_validate(candidates)
-
-    # Score designation match via LLM for top candidates (limit calls)
-    for c in candidates[:5]:
-        snippet_context = ""
-        for r in merged:
-            if c["full_name"].lower() in (r.get("snippet", "") + " " + r.get("title", "")).lower():
-                snippet_context += r.get("snippet", "") + " "
-        c["designation_match_score"] = _validate_designation_llm(
-            c["full_name"], company, designation, snippet_context
+    candidates = _cross_validate(candidates, extra_engines)
+
+    # Score designation match via LLM for top candidates (limit calls).
+    # A cheap prior from source credibility + cross-engine agreement ranks
+    # the pool first; LLM round-trips are spent only on candidates whose
+    # prior clears the bar, the rest inherit the prior as their score.
+    priors = {
+        id(c): (
+            0.6 * c.get("source_credibility", DEFAULT_CREDIBILITY)
+            + 0.4 * (1.0 if c.get("cross_engine_validated") else 0.0)
         )
+        for c in candidates
+    }
+    candidates.sort(key=lambda c: priors[id(c)], reverse=True)
+
+    top_candidates = candidates[:5]
+    to_score = [c for c in top_candidates if priors[id(c)] >= 0.5][:3]
+    scored_ids = {id(c) for c in to_score}
+    for c in top_candidates:
+        if id(c) not in scored_ids:
+            c["designation_match_score"] = priors[id(c)]
+
+    # Lowercase each result once up front instead of per candidate
+    merged_lc = [
+        (r.get("snippet", ""), (r.get("snippet", "") + " " + r.get("title", "")).lower())
+        for r in merged
+    ]
+    pairs: List[Dict[str, str]] = []
+    for c in to_score:
+        name_lc = c["full_name"].lower()
+        snippet_context = " ".join(snip for snip, lc in merged_lc if name_lc in lc)
+        pairs.append({"name": c["full_name"], "snippet": snippet_context})
+
+    scores = _validate_designations_llm_batch(pairs, company, designation)
+    for c, score in zip(to_score, scores):
+        c["designation_match_score"] = score
 
     logger.info("Validator extracted %d candidates", len(candidates))
 
+    # Partial update — LangGraph merges changed keys into the state
     return {
-        **state,
         "validated_candidates": candidates,
     }
@@ -5,6 +5,7 @@ Constructs the Researcher → Validator → Reporter pipeline
 with a conditional retry if confidence is below threshold.
 """
 
+import functools
 from typing import Any, Dict
 
 from langgraph.graph import END, StateGraph
@@ -44,6 +45,17 @@ def reporter_node(state: Dict[str, Any]) -> Dict[str, Any]:
     return run_reporter(state)
 
 
+def _reset_pipeline_fields() -> Dict[str, Any]:
+    """Fresh empty values for every downstream pipeline output field."""
+    return {
+        "serp_results": [],
+        "ddg_results": [],
+        "merged_results": [],
+        "validated_candidates": [],
+        "final_output": {},
+    }
+
+
 def refine_query_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """Refine queries for retry: broaden the search terms.
 
@@ -62,15 +74,11 @@ def refine_query_node(state: Dict[str, Any]) -> Dict[str, Any]:
 
     logger.info("Refining queries (retry #%d): %s", retry_count + 1, refined_queries)
 
+    # Partial update — LangGraph merges changed keys into the state
     return {
-        **state,
         "queries": refined_queries,
-        "serp_results": [],
-        "ddg_results": [],
-        "merged_results": [],
-        "validated_candidates": [],
-        "final_output": {},
         "retry_count": retry_count + 1,
+        **_reset_pipeline_fields(),
     }
 
 
@@ -102,9 +110,13 @@ def should_retry(state: Dict[str, Any]) -> str:
 # Build the graph
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def build_person_finder_graph() -> StateGraph:
     """Construct and compile the LangGraph workflow.
 
+    The compiled graph is stateless between invocations, so it is built
+    once and cached — repeat `find_person` calls skip recompilation.
+
     Graph:
         researcher → validator → reporter → (retry check)
         If confidence < 0.5 and retries left → refine_query → researcher (loop)
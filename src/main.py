@@ -5,7 +5,8 @@ Provides a high-level `find_person()` function that orchestrates
 the full LangGraph pipeline and returns structured JSON output.
 """
 
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Tuple
 
 from dotenv import load_dotenv
 
@@ -14,6 +15,14 @@ from src.utilis.logger import logger
 
 load_dotenv()
 
+# ---------------------------------------------------------------------------
+# Result cache — repeat lookups for the same (company, designation) within
+# the TTL skip the whole pipeline (searches, scrapes, and LLM calls).
+# Error payloads are never cached so transient failures retry immediately.
+# ---------------------------------------------------------------------------
+_RESULT_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_CACHE_TTL_SECONDS = 3600.0
+
 
 def find_person(company: str, designation: str) -> Dict[str, Any]:
     """Run the PersonFinder pipeline for a given company + designation.
@@ -32,6 +41,12 @@ def find_person(company: str, designation: str) -> Dict[str, Any]:
     if not company.strip() or not designation.strip():
         return {"error": "Company and designation are required", "confidence_score": 0.0}
 
+    cache_key = (company.strip().lower(), designation.strip().lower())
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached and time.time() - cached[0] < _CACHE_TTL_SECONDS:
+        logger.info("Returning cached result for %s", cache_key)
+        return dict(cached[1])
+
     try:
         graph = build_person_finder_graph()
 
@@ -54,6 +69,9 @@ def find_person(company: str, designation: str) -> Dict[str, Any]:
         if not result:
             result = {"error": "No verified results found", "confidence_score": 0.0}
 
+        if "error" not in result:
+            _RESULT_CACHE[cache_key] = (time.time(), dict(result))
+
         logger.info("PersonFinder completed — result: %s", result)
         return result
 
@@ -3,16 +3,22 @@
 from src.tools.search_tools import (
     serpapi_search,
     duckduckgo_search,
+    combined_search,
+    run_searches,
     merge_and_deduplicate,
     scrape_page,
+    scrape_pages,
 )
 from src.tools.scraper import ContentScraper, scrape_url
 
 __all__ = [
     "serpapi_search",
     "duckduckgo_search",
+    "combined_search",
+    "run_searches",
     "merge_and_deduplicate",
     "scrape_page",
+    "scrape_pages",
     "ContentScraper",
     "scrape_url",
 ]
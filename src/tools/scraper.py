@@ -6,19 +6,43 @@ Handles static pages (requests + BeautifulSoup), dynamic/JS-heavy pages
 Used by the Validator agent to fetch rich page text for name extraction.
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import io
 import json
 import logging
 import os
 import re
+import tempfile
+import threading
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
 from readability import Document
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import xxhash  # optional fast non-cryptographic hash
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+
+try:
+    import orjson  # optional fast JSON serializer
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 try:
     import fitz  # PyMuPDF
 except ImportError:
@@ -42,28 +66,163 @@ except ImportError:
 
 logger = logging.getLogger("person_finder.scraper")
 
+# Domain → platform map for social-media detection, hoisted to module
+# scope; suffix tuple enables one C-level endswith over all domains.
+_SOCIAL_PLATFORMS = {
+    "twitter.com": "Twitter",
+    "x.com": "Twitter",
+    "facebook.com": "Facebook",
+    "instagram.com": "Instagram",
+    "linkedin.com": "LinkedIn",
+    "youtube.com": "YouTube",
+    "tiktok.com": "TikTok",
+    "reddit.com": "Reddit",
+}
+_SOCIAL_SUFFIXES = tuple(f".{domain}" for domain in _SOCIAL_PLATFORMS)
+
+# Sentinel selectors proving that a static fetch already contains the
+# platform's post content, making the Selenium fallback unnecessary.
+_PLATFORM_SENTINELS = {
+    "Twitter": '[data-testid="tweetText"], .tweet-text, [data-testid="tweet"]',
+    "Facebook": '[data-ad-preview="message"], .userContent, [data-testid="post_message"]',
+    "Reddit": 'shreddit-post, [data-test-id="post-content"], div[class*="usertext-body"]',
+}
+
+_TWEET_ID_RE = re.compile(r"/status(?:es)?/(\d+)")
+_TWEET_SYNDICATION_URL = "https://cdn.syndication.twimg.com/tweet-result"
+
+# Meta tags worth extracting, keyed by property/name attribute
+_META_MAPPINGS = {
+    "og:title": "title",
+    "twitter:title": "title",
+    "og:description": "description",
+    "twitter:description": "description",
+    "og:site_name": "site_name",
+    "og:url": "canonical_url",
+    "article:published_time": "published_time",
+    "article:author": "author",
+    "og:type": "content_type",
+}
+_META_NAMES = frozenset(_META_MAPPINGS)
+
+
+# One pass over the byline: strips a leading "By " and turns the
+# " and " / "&" separators into commas for splitting.
+_AUTHOR_RE = re.compile(r"^by\s+|\s+and\s+|\s*&\s*", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_author(name: str) -> str:
+    """Title-case an author name (cached — bylines repeat across pages)."""
+    return name.title()
+
+
+if xxhash is not None:
+    def _text_fingerprint(text: str) -> int:
+        """64-bit xxh64 fingerprint of *text* for constant-size dedup keys."""
+        return xxhash.xxh64_intdigest(text.encode("utf-8"))
+else:
+    def _text_fingerprint(text: str) -> int:
+        """Fingerprint of *text* via built-in hash (xxhash not installed)."""
+        return hash(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _platform_for_netloc(netloc: str):
+    """Return (platform_name, is_social) for a lowercased netloc."""
+    platform = _SOCIAL_PLATFORMS.get(netloc)
+    if platform:
+        return platform, True
+    if netloc.endswith(_SOCIAL_SUFFIXES):
+        for domain, name in _SOCIAL_PLATFORMS.items():
+            if netloc.endswith(f".{domain}"):
+                return name, True
+    return netloc, False
+
+# Precompiled (pattern, strptime format) pairs for the common date shapes.
+# strptime on a matched shape is far cheaper than dateutil's full parser.
+_DATE_PATTERNS = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{2}/\d{2}/\d{4}"), "%m/%d/%Y"),
+    (re.compile(r"\d{2}-\d{2}-\d{4}"), "%m-%d-%Y"),
+    (re.compile(r"\w+ \d{1,2}, \d{4}"), "%B %d, %Y"),
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_string: str) -> Optional[str]:
+    """Normalize a date string to ISO-8601 (memoized — publish dates repeat).
+
+    Plain dates matching a known shape go straight to strptime; anything
+    richer (timestamps, timezones) falls back to dateutil's full parser.
+    """
+    stripped = date_string.strip()
+    for pattern, fmt in _DATE_PATTERNS:
+        if pattern.fullmatch(stripped):
+            try:
+                return datetime.strptime(stripped, fmt).isoformat()
+            except ValueError:
+                break
+
+    if dateutil_parser is not None:
+        try:
+            return dateutil_parser.parse(date_string).isoformat()
+        except Exception:
+            pass
+        for pattern, _ in _DATE_PATTERNS:
+            match = pattern.search(date_string)
+            if match:
+                try:
+                    return dateutil_parser.parse(match.group()).isoformat()
+                except Exception:
+                    continue
+    return date_string
+
 # ═══════════════════════════════════════════════════════════════════════════
 # ContentScraper
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# Default request headers, built once; every Session instance applies
+# them at construction so no per-request headers= dict is needed.
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/91.0.4472.124 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Connection": "keep-alive",
+    # No br: urllib3 only decodes brotli when a decoder package is
+    # installed, and advertising it without one yields raw brotli bytes
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
 class ContentScraper:
     """Full-featured web scraper with requests → Selenium fallback."""
 
     def __init__(self, headless: bool = True, wait_time: int = 10) -> None:
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/91.0.4472.124 Safari/537.36"
-                )
-            }
+        self.session.headers.update(_DEFAULT_HEADERS)
+        # Pool and reuse connections (keep-alive saves a TCP + TLS round
+        # trip per request to the same host) and retry transient errors.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
         )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.headless = headless
         self.wait_time = wait_time
         self.driver = None
+        # Single Selenium driver — serialize access from concurrent tasks
+        self._driver_lock = threading.Lock()
 
     # -------------------------------------------------------------------
     # Selenium helpers
@@ -99,47 +258,38 @@ class ContentScraper:
 
     def _identify_platform(self, url: str):
         """Identify the platform/website type."""
-        domain = urlparse(url).netloc.lower()
-
-        social_platforms = {
-            "twitter.com": "Twitter",
-            "x.com": "Twitter",
-            "facebook.com": "Facebook",
-            "instagram.com": "Instagram",
-            "linkedin.com": "LinkedIn",
-            "youtube.com": "YouTube",
-            "tiktok.com": "TikTok",
-            "reddit.com": "Reddit",
-        }
-
-        for platform_domain, platform_name in social_platforms.items():
-            if domain == platform_domain or domain.endswith(f".{platform_domain}"):
-                return platform_name, True
-
-        return domain, False
+        return _platform_for_netloc(urlparse(url).netloc.lower())
 
     # -------------------------------------------------------------------
     # Readability extraction
     # -------------------------------------------------------------------
 
+    # Tags read out of the readability summary
+    _READABLE_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6", "p")
+
     def _extract_readable_content(self, html: str):
-        """Extract main content via python-readability."""
+        """Extract main content via python-readability.
+
+        The summary fragment is walked with lxml directly — iter() and
+        text_content() run in C, where the BeautifulSoup equivalent was a
+        Python-level tree walk (and held the GIL throughout).
+        """
         try:
             doc = Document(html)
             title = doc.short_title()
             summary_html = doc.summary()
 
-            soup = BeautifulSoup(summary_html, "html.parser")
+            root = lxml_html.fromstring(summary_html)
             lines: List[str] = []
 
-            for elem in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6", "p"]):
-                text = elem.get_text(strip=True)
+            for elem in root.iter(*self._READABLE_TAGS):
+                text = elem.text_content().strip()
                 if not text:
                     continue
-                if elem.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                    lines.append(f"\n\n## {text}")
-                else:
+                if elem.tag == "p":
                     lines.append(text)
+                else:
+                    lines.append(f"\n\n## {text}")
 
             full_text = "\n\n".join(lines)
             return title, full_text
@@ -151,18 +301,68 @@ class ContentScraper:
     # Content fetchers
     # -------------------------------------------------------------------
 
-    def _extract_with_requests(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch page with requests + BeautifulSoup."""
+    # Never buffer more than this much HTML per page
+    _MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+    # Partial-content window requested via the Range header; plenty for
+    # the head plus the article body on typical pages
+    _RANGE_BYTES = 128 * 1024
+
+    def _extract_with_requests(
+        self, url: str, strainer: Optional[SoupStrainer] = None
+    ) -> Optional[BeautifulSoup]:
+        """Fetch page with requests + BeautifulSoup.
+
+        Streams the body with a 10 MB hard cap and skips non-HTML content
+        types outright, so a binary or runaway page can't OOM the parser.
+
+        Args:
+            url: Page URL.
+            strainer: Optional SoupStrainer to parse only a subset of tags
+                when the caller doesn't need the full document tree.
+        """
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, "html.parser")
+            # Ask for the first 128 KB only — downstream extraction keeps a
+            # few KB of text, so the tail of a large page is never used.
+            # Servers ignoring Range return 200 with the full body, which
+            # the streaming cap below still bounds.
+            headers = {"Range": f"bytes=0-{self._RANGE_BYTES - 1}"}
+            response = self.session.get(
+                url, headers=headers, stream=True, timeout=30
+            )
+            if response.status_code == 416:  # Range not satisfiable
+                response.close()
+                response = self.session.get(url, stream=True, timeout=30)
+            with response:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "").lower()
+                if content_type and not content_type.startswith(
+                    ("text/", "application/xhtml", "application/xml")
+                ):
+                    logger.warning("Skipping non-HTML content (%s): %s", content_type, url)
+                    return None
+
+                buf = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=65536):
+                    buf.write(chunk)
+                    if buf.tell() > self._MAX_RESPONSE_BYTES:
+                        logger.warning("Truncating oversized response: %s", url)
+                        break
+            return BeautifulSoup(buf.getvalue(), "lxml", parse_only=strainer)
         except Exception as e:
             logger.warning("Requests extraction failed: %s", e)
             return None
 
-    def _extract_with_selenium(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch page via Selenium (JS-rendered)."""
+    def _extract_with_selenium(
+        self, url: str, sentinel_css: Optional[str] = None
+    ) -> Optional[BeautifulSoup]:
+        """Fetch page via Selenium (JS-rendered).
+
+        Args:
+            url: Page URL.
+            sentinel_css: Optional CSS selector to wait for instead of a
+                fixed sleep — returns as soon as the content renders.
+        """
         if not SELENIUM_AVAILABLE:
             logger.warning("Selenium not installed — skipping dynamic extraction")
             return None
@@ -172,13 +372,30 @@ class ContentScraper:
             WebDriverWait(self.driver, self.wait_time).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            time.sleep(3)
+            if sentinel_css:
+                try:
+                    WebDriverWait(self.driver, 5).until(
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, sentinel_css)
+                        )
+                    )
+                except TimeoutException:
+                    logger.warning("Sentinel %s never appeared", sentinel_css)
+            else:
+                time.sleep(3)
             self._click_read_more_buttons()
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            return BeautifulSoup(self.driver.page_source, "lxml")
         except Exception as e:
             logger.warning("Selenium extraction failed: %s", e)
             return None
 
+    def _soup_has_content(self, soup: BeautifulSoup, platform: str) -> bool:
+        """Return True when the static fetch already has usable content."""
+        sentinel = _PLATFORM_SENTINELS.get(platform)
+        if sentinel:
+            return soup.select_one(sentinel) is not None
+        return soup.find("p") is not None or soup.find("article") is not None
+
     def _click_read_more_buttons(self) -> None:
         """Click any 'Read More' buttons (Taboola, etc.)."""
         if not self.driver:
@@ -206,65 +423,53 @@ class ContentScraper:
     # -------------------------------------------------------------------
 
     def _extract_meta_tags(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract metadata from <meta> tags."""
+        """Extract metadata from <meta> tags.
+
+        Queries only the whitelisted property/name values instead of
+        iterating every meta tag in the document.
+        """
         meta_data: Dict[str, str] = {}
-        meta_mappings = {
-            "og:title": "title",
-            "twitter:title": "title",
-            "og:description": "description",
-            "twitter:description": "description",
-            "og:site_name": "site_name",
-            "og:url": "canonical_url",
-            "article:published_time": "published_time",
-            "article:author": "author",
-            "og:type": "content_type",
-        }
-        for meta_tag in soup.find_all("meta"):
-            property_val = meta_tag.get("property") or meta_tag.get("name")
+        matches = soup.find_all("meta", property=lambda v: v in _META_NAMES)
+        matches += soup.find_all("meta", attrs={"name": lambda v: v in _META_NAMES})
+        for meta_tag in matches:
+            # The tag may carry both attributes with only one whitelisted
+            # (e.g. property="al:ios" name="twitter:title") — use whichever
+            # actually maps to a field.
+            key = meta_tag.get("property")
+            if key not in _META_MAPPINGS:
+                key = meta_tag.get("name")
+            field = _META_MAPPINGS.get(key)
             content = meta_tag.get("content")
-            if property_val and content and property_val in meta_mappings:
-                meta_data[meta_mappings[property_val]] = content
+            if field and content:
+                meta_data[field] = content
         return meta_data
 
     def _parse_date(self, date_string: Optional[str]) -> Optional[str]:
         """Parse various date formats into ISO-8601."""
         if not date_string:
             return None
-        if dateutil_parser is not None:
-            try:
-                return dateutil_parser.parse(date_string).isoformat()
-            except Exception:
-                pass
-        patterns = [
-            r"\d{4}-\d{2}-\d{2}",
-            r"\d{2}/\d{2}/\d{4}",
-            r"\d{2}-\d{2}-\d{4}",
-            r"\w+ \d{1,2}, \d{4}",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, date_string)
-            if match and dateutil_parser is not None:
-                try:
-                    return dateutil_parser.parse(match.group()).isoformat()
-                except Exception:
-                    continue
-        return date_string
+        return _parse_date_cached(date_string)
 
     # -------------------------------------------------------------------
     # Text / author extraction helpers
     # -------------------------------------------------------------------
 
     def _extract_text_from_element(self, element) -> List[str]:
+        # Iterative stack walk: deeply nested div/ul trees would otherwise
+        # recurse once per level and risk hitting the recursion limit.
         lines: List[str] = []
-        if element.name in ["h1", "h2", "h3", "h4"]:
-            lines.append(f"\n\n## {element.get_text(strip=True)}")
-        elif element.name == "li":
-            lines.append(f"- {element.get_text(strip=True)}")
-        elif element.name == "p":
-            lines.append(element.get_text(strip=True))
-        elif element.name in ["ul", "ol", "div"]:
-            for child in element.find_all(recursive=False):
-                lines.extend(self._extract_text_from_element(child))
+        stack = [element]
+        while stack:
+            el = stack.pop()
+            if el.name in ("h1", "h2", "h3", "h4"):
+                lines.append(f"\n\n## {el.get_text(strip=True)}")
+            elif el.name == "li":
+                lines.append(f"- {el.get_text(strip=True)}")
+            elif el.name == "p":
+                lines.append(el.get_text(strip=True))
+            elif el.name in ("ul", "ol", "div"):
+                # Reverse so children pop in document order
+                stack.extend(reversed(el.find_all(recursive=False)))
         return lines
 
     def _extract_authors(self, soup: BeautifulSoup) -> List[str]:
@@ -281,26 +486,24 @@ class ContentScraper:
                 text = tag.get_text(" ", strip=True)
                 if not text:
                     continue
-                cleaned = (
-                    text.replace("By ", "")
-                    .replace("BY ", "")
-                    .replace("by ", "")
-                    .replace(" and ", ",")
-                    .replace("&", ",")
+                cleaned = _AUTHOR_RE.sub(
+                    lambda m: "" if m.group(0).strip().lower() == "by" else ",",
+                    text,
                 )
                 for part in cleaned.split(","):
                     part = part.strip()
                     if part and len(part.split()) <= 4:
-                        authors.add(part.title())
+                        authors.add(_normalize_author(part))
         return sorted(authors)
 
     # -------------------------------------------------------------------
     # Article content extraction
     # -------------------------------------------------------------------
 
-    def _extract_article_content(self, soup: BeautifulSoup, platform: str) -> str:
-        """Extract structured article content without duplication."""
-        content_selectors = [
+    # All candidate content selectors merged into one union so the engine
+    # walks the DOM once instead of once per selector.
+    _ARTICLE_SELECTOR = ", ".join(
+        [
             '[itemprop="articleBody"]',
             '[class*="article-content"]',
             '[class*="article-body"]',
@@ -327,47 +530,138 @@ class ContentScraper:
             "article",
             "main",
         ]
+    )
+
+    # A block this rich is clearly the article body — stop scanning
+    _ARTICLE_SCORE_THRESHOLD = 40
+
+    # Downstream consumers (scrape_page) keep a few thousand characters at
+    # most, so text accumulation stops once it comfortably exceeds that
+    _MAX_ARTICLE_CHARS = 8000
 
+    def _extract_article_content(self, soup: BeautifulSoup, platform: str) -> str:
+        """Extract structured article content without duplication."""
         best_block = None
         max_score = 0
 
-        for selector in content_selectors:
-            for element in soup.select(selector):
-                for tag in element(
-                    [
-                        "script", "style", "nav", "footer", "aside",
-                        "form", "iframe", ".adsbygoogle",
-                    ]
-                ):
-                    tag.decompose()
-                score = len(element.find_all("p")) + len(
-                    element.find_all(["h2", "h3", "li"])
-                )
-                if score > max_score:
-                    best_block = element
-                    max_score = score
+        for element in soup.select(self._ARTICLE_SELECTOR):
+            for tag in element(
+                [
+                    "script", "style", "nav", "footer", "aside",
+                    "form", "iframe", ".adsbygoogle",
+                ]
+            ):
+                tag.decompose()
+            score = len(element.find_all("p")) + len(
+                element.find_all(["h2", "h3", "li"])
+            )
+            if score > max_score:
+                best_block = element
+                max_score = score
+                if max_score > self._ARTICLE_SCORE_THRESHOLD:
+                    break
 
         if not best_block:
             return ""
 
         lines: List[str] = []
+        total_chars = 0
+        # Store fingerprints instead of whole paragraphs — membership
+        # checks stay constant-size for kilobyte-long blocks.
         processed: set = set()
 
         for tag in best_block.find_all(
             ["h1", "h2", "h3", "li", "p", "ul", "ol"], recursive=True
         ):
+            if total_chars >= self._MAX_ARTICLE_CHARS:
+                break
             text = tag.get_text(strip=True)
-            if text and text not in processed:
+            if not text:
+                continue
+            fingerprint = _text_fingerprint(text)
+            if fingerprint not in processed:
                 if tag.name in ["h1", "h2", "h3"]:
                     lines.append(f"\n\n## {text}")
                 elif tag.name == "li":
                     lines.append(f"- {text}")
                 else:
                     lines.append(text)
-                processed.add(text)
+                processed.add(fingerprint)
+                total_chars += len(text)
 
         return "\n".join(lines)
 
+    # -------------------------------------------------------------------
+    # Social-media JSON API fast paths
+    # -------------------------------------------------------------------
+
+    def _fetch_reddit_json(self, url: str) -> Optional[Dict[str, str]]:
+        """Fetch a Reddit post via the public .json endpoint."""
+        try:
+            parts = urlparse(url)
+            json_url = f"{parts.scheme}://{parts.netloc}{parts.path.rstrip('/')}.json"
+            response = self.session.get(json_url, timeout=15)
+            response.raise_for_status()
+            post = response.json()[0]["data"]["children"][0]["data"]
+            return {
+                "title": post.get("title", ""),
+                "text": post.get("selftext", "") or post.get("title", ""),
+                "author": post.get("author", ""),
+                "subreddit": post.get("subreddit", ""),
+            }
+        except Exception as e:
+            logger.warning("Reddit JSON endpoint failed for %s: %s", url, e)
+            return None
+
+    def _fetch_tweet_json(self, url: str) -> Optional[Dict[str, str]]:
+        """Fetch a tweet via Twitter's public syndication endpoint."""
+        match = _TWEET_ID_RE.search(urlparse(url).path)
+        if not match:
+            return None
+        try:
+            response = self.session.get(
+                _TWEET_SYNDICATION_URL,
+                params={"id": match.group(1), "lang": "en"},
+                timeout=15,
+            )
+            response.raise_for_status()
+            payload = response.json()
+            return {
+                "text": payload.get("text", ""),
+                "author": (payload.get("user") or {}).get("name", ""),
+            }
+        except Exception as e:
+            logger.warning("Tweet syndication endpoint failed for %s: %s", url, e)
+            return None
+
+    def _extract_social_via_api(
+        self, url: str, platform: str
+    ) -> Optional[Dict[str, Any]]:
+        """Try the platform's JSON API — a single small GET instead of a
+        headless-browser render. Returns a full result dict or None.
+        """
+        data: Optional[Dict[str, str]] = None
+        if platform == "Reddit":
+            data = self._fetch_reddit_json(url)
+        elif platform == "Twitter":
+            data = self._fetch_tweet_json(url)
+        if not data or not data.get("text"):
+            return None
+
+        result: Dict[str, Any] = {
+            "url": url,
+            "platform": platform,
+            "is_social_media": True,
+            "title": "",
+            "text": "",
+            "author": "",
+            "publisher": platform,
+            "published_date": None,
+            "site_name": platform,
+        }
+        result.update(data)
+        return result
+
     # -------------------------------------------------------------------
     # Social-media extractors
     # -------------------------------------------------------------------
@@ -440,25 +734,30 @@ class ContentScraper:
     # -------------------------------------------------------------------
 
     def _extract_pdf_content(self, url: str) -> Dict[str, Any]:
-        logger.info("Downloading PDF: %s", url)
-        response = self.session.get(url)
-        response.raise_for_status()
-
-        tmp_path = "temp_scraper.pdf"
-        with open(tmp_path, "wb") as f:
-            f.write(response.content)
-
         text = ""
-        if fitz is not None:
-            doc = fitz.open(tmp_path)
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-        else:
+        if fitz is None:
             logger.warning("PyMuPDF not installed — cannot parse PDF")
+        else:
+            logger.info("Downloading PDF: %s", url)
+            # Stream to a unique temp file (concurrency-safe) so the full
+            # PDF is never buffered in memory.
+            with self.session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with tempfile.NamedTemporaryFile(
+                    suffix=".pdf", delete=False
+                ) as tmp:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        tmp.write(chunk)
+                    tmp_path = tmp.name
 
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+            try:
+                parts: List[str] = []
+                with fitz.open(tmp_path) as doc:
+                    for page in doc:
+                        parts.append(page.get_text("text"))
+                text = "\n".join(parts)
+            finally:
+                os.remove(tmp_path)
 
         return {
             "url": url,
@@ -499,16 +798,38 @@ class ContentScraper:
 
         platform, is_social = self._identify_platform(url)
 
-        # Try requests first, then Selenium if needed
+        # Social platforms: prefer the JSON API over any HTML scraping
+        if is_social:
+            api_result = self._extract_social_via_api(url, platform)
+            if api_result:
+                return api_result
+
+        # Try requests first; only pay for Selenium when the static fetch
+        # failed or a social page came back without its post content.
         soup = self._extract_with_requests(url)
 
-        if not soup or is_social:
+        if not soup:
             logger.info("Using Selenium for dynamic content extraction")
-            soup = self._extract_with_selenium(url)
+            soup = self._extract_with_selenium_locked(
+                url, _PLATFORM_SENTINELS.get(platform)
+            )
+        elif is_social and not self._soup_has_content(soup, platform):
+            logger.info("Static HTML lacks %s content — using Selenium", platform)
+            soup = self._extract_with_selenium_locked(
+                url, _PLATFORM_SENTINELS.get(platform)
+            ) or soup
 
         if not soup:
             raise RuntimeError(f"Failed to extract content from {url}")
 
+        # Driver and Session are left open so repeat calls on a long-lived
+        # scraper reuse them; callers owning the instance (or atexit) close it.
+        return self._build_result(url, soup, platform, is_social)
+
+    def _build_result(
+        self, url: str, soup: BeautifulSoup, platform: str, is_social: bool
+    ) -> Dict[str, Any]:
+        """Assemble the structured content dict from a parsed page."""
         meta_data = self._extract_meta_tags(soup)
 
         result: Dict[str, Any] = {
@@ -523,11 +844,16 @@ class ContentScraper:
             "site_name": platform,
         }
 
+        # Each element is looked up once; the inline `x if find(x) else` forms
+        # used to walk the DOM twice per source.
+        title_el = soup.find("title")
+        h1_el = soup.find("h1")
+
         # Title
         for title_source in [
             meta_data.get("title"),
-            soup.find("title").get_text(strip=True) if soup.find("title") else None,
-            soup.find("h1").get_text(strip=True) if soup.find("h1") else None,
+            title_el.get_text(strip=True) if title_el else None,
+            h1_el.get_text(strip=True) if h1_el else None,
         ]:
             if title_source and title_source.strip():
                 result["title"] = title_source.strip()
@@ -554,18 +880,12 @@ class ContentScraper:
             result["publisher"] = meta_data.get("site_name") or platform
 
         # Date
+        time_el = soup.select_one("time")
+        date_el = soup.select_one(".date, .publish-date, .post-date")
         for date_source in [
             meta_data.get("published_time"),
-            (
-                soup.select_one("time")["datetime"]
-                if soup.select_one("time") and soup.select_one("time").get("datetime")
-                else None
-            ),
-            (
-                soup.select_one(".date, .publish-date, .post-date").get_text(strip=True)
-                if soup.select_one(".date, .publish-date, .post-date")
-                else None
-            ),
+            time_el.get("datetime") if time_el else None,
+            date_el.get_text(strip=True) if date_el else None,
         ]:
             if date_source:
                 parsed_date = self._parse_date(date_source)
@@ -573,9 +893,151 @@ class ContentScraper:
                     result["published_date"] = parsed_date
                     break
 
-        self._close_driver()
         return result
 
+    # -------------------------------------------------------------------
+    # Async batch scraping
+    # -------------------------------------------------------------------
+
+    _MAX_CONCURRENT_FETCHES = 20
+
+    def _extract_with_selenium_locked(
+        self, url: str, sentinel_css: Optional[str] = None
+    ) -> Optional[BeautifulSoup]:
+        """Selenium fetch guarded by the driver lock (one shared driver)."""
+        with self._driver_lock:
+            return self._extract_with_selenium(url, sentinel_css)
+
+    async def _scrape_one_async(
+        self, client: "httpx.AsyncClient", url: str
+    ) -> Dict[str, Any]:
+        """Async counterpart of :meth:`scrape_content` on a shared client."""
+        # Check for PDF
+        try:
+            head = await client.head(url, follow_redirects=True, timeout=10)
+            content_type = head.headers.get("Content-Type", "").lower()
+            if content_type.startswith("application/pdf") or url.lower().endswith(".pdf"):
+                return await asyncio.to_thread(self._extract_pdf_content, url)
+        except Exception as e:
+            logger.warning("Failed to check content type: %s", e)
+
+        platform, is_social = self._identify_platform(url)
+
+        # Social platforms: prefer the JSON API over any HTML scraping
+        if is_social:
+            api_result = await asyncio.to_thread(
+                self._extract_social_via_api, url, platform
+            )
+            if api_result:
+                return api_result
+
+        html: Optional[bytes] = None
+        try:
+            response = await client.get(url, timeout=30)
+            response.raise_for_status()
+            html = response.content
+        except Exception as e:
+            logger.warning("Async extraction failed: %s", e)
+
+        # Non-social pages need no sentinel check, so the whole CPU-bound
+        # parse + extraction runs in a worker process; only raw bytes cross
+        # the pickle boundary.
+        if html is not None and not is_social:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                _parse_pool(), parse_page, html, url, platform, is_social
+            )
+
+        soup: Optional[BeautifulSoup] = None
+        if html is not None:
+            soup = await asyncio.to_thread(BeautifulSoup, html, "lxml")
+
+        if soup is not None and is_social and not self._soup_has_content(soup, platform):
+            logger.info("Static HTML lacks %s content — using Selenium", platform)
+            soup = await asyncio.to_thread(
+                self._extract_with_selenium_locked,
+                url,
+                _PLATFORM_SENTINELS.get(platform),
+            ) or soup
+        elif not soup:
+            logger.info("Using Selenium for dynamic content extraction")
+            soup = await asyncio.to_thread(
+                self._extract_with_selenium_locked,
+                url,
+                _PLATFORM_SENTINELS.get(platform),
+            )
+
+        if not soup:
+            raise RuntimeError(f"Failed to extract content from {url}")
+
+        return await asyncio.to_thread(self._build_result, url, soup, platform, is_social)
+
+    async def scrape_many_async(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Scrape several URLs concurrently.
+
+        Fetches run over one pooled httpx client bounded by a semaphore;
+        parsing and Selenium/PDF fallbacks run on worker threads. Without
+        httpx installed, the sync path is fanned out onto threads instead.
+
+        Args:
+            urls: Web page URLs.
+
+        Returns:
+            One structured content dict per URL (empty-text dict on failure).
+        """
+        semaphore = asyncio.Semaphore(self._MAX_CONCURRENT_FETCHES)
+
+        if httpx is None:
+            async def _bounded(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await asyncio.to_thread(self.scrape_content, url)
+
+            outcomes = await asyncio.gather(
+                *(_bounded(u) for u in urls), return_exceptions=True
+            )
+        else:
+            async def _bounded_client(
+                client: "httpx.AsyncClient", url: str
+            ) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._scrape_one_async(client, url)
+
+            async with httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            ) as client:
+                outcomes = await asyncio.gather(
+                    *(_bounded_client(client, u) for u in urls),
+                    return_exceptions=True,
+                )
+            self._close_driver()
+
+        results: List[Dict[str, Any]] = []
+        for url, outcome in zip(urls, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Error scraping %s: %s", url, outcome)
+                results.append(
+                    {
+                        "url": url,
+                        "platform": urlparse(url).netloc,
+                        "is_social_media": False,
+                        "title": "",
+                        "text": "",
+                        "author": "",
+                        "publisher": "",
+                        "published_date": None,
+                        "site_name": "",
+                    }
+                )
+            else:
+                results.append(outcome)
+        return results
+
+    def scrape_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Synchronous wrapper around :meth:`scrape_many_async`."""
+        return asyncio.run(self.scrape_many_async(urls))
+
     # -------------------------------------------------------------------
     # Convenience helpers
     # -------------------------------------------------------------------
@@ -583,12 +1045,49 @@ class ContentScraper:
     def save_to_json(self, data: Dict[str, Any], filename: Optional[str] = None) -> str:
         if filename is None:
             filename = "data.json"
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly and serializes datetimes
+            # natively, skipping stdlib json's per-character escaping
+            with open(filename, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         logger.info("Data saved to %s", filename)
         return filename
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Multiprocess parsing helpers
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Shared process pool for CPU-bound HTML parsing (spawned lazily)."""
+    return concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+@functools.lru_cache(maxsize=1)
+def _worker_scraper() -> "ContentScraper":
+    """Per-process ContentScraper backing :func:`parse_page`."""
+    return ContentScraper()
+
+
+def parse_page(html: bytes, url: str, platform: str, is_social: bool) -> Dict[str, Any]:
+    """Parse raw HTML into the structured content dict.
+
+    Takes only picklable arguments so it can run in a worker process,
+    keeping lxml/BeautifulSoup work off the asyncio event loop.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    return _worker_scraper()._build_result(url, soup, platform, is_social)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Module-level convenience function
 # ═══════════════════════════════════════════════════════════════════════════
@@ -603,3 +1102,5 @@ def scrape_url(url: str, output_file: Optional[str] = None):
     except Exception as e:
         logger.error("Error scraping %s: %s", url, e)
         raise
+    finally:
+        scraper._close_driver()
@@ -2,35 +2,150 @@
 Search tools for PersonFinderTool.
 
 Provides SerpAPI (Google) and DuckDuckGo search functions with
-rate-limiting, exception handling, and structured output.
+rate-limiting, exception handling, and structured output. Async
+variants are available for fanning out several queries concurrently.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import itertools
 import os
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
 
+import aiohttp
 import requests
 from bs4 import BeautifulSoup
 from ddgs import DDGS
 from dotenv import load_dotenv
 
+try:
+    import xxhash  # optional fast non-cryptographic hash
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+
 from src.utilis.logger import logger
 
 load_dotenv()
 
+
+# ---------------------------------------------------------------------------
+# Shared HTTP session — keep-alive pooling means repeat calls to the same
+# host (SerpAPI on every query) skip the TCP+TLS handshake.
+# ---------------------------------------------------------------------------
+_SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=32, pool_maxsize=32, max_retries=1
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Persistent DuckDuckGo client — constructing DDGS() per call would spin
+# up a fresh HTTP client (new TLS handshake) for every query.
+_DDGS: Optional[DDGS] = None
+_ddgs_lock = threading.Lock()
+
+
+def _get_ddgs() -> DDGS:
+    """Return the lazily-constructed shared DDGS client."""
+    global _DDGS
+    if _DDGS is None:
+        with _ddgs_lock:
+            if _DDGS is None:
+                client = DDGS()
+                atexit.register(client.__exit__, None, None, None)
+                _DDGS = client
+    return _DDGS
+
+
+# ---------------------------------------------------------------------------
+# Search-result TTL cache — refined-query retries and adjacent sessions
+# repeat the same engine lookups, so fresh hits skip the network entirely.
+# Same (timestamp, value) layout as the find_person result cache.
+# ---------------------------------------------------------------------------
+_SEARCH_CACHE: Dict[Tuple[str, str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+_SEARCH_CACHE_TTL = 3600.0  # seconds
+_SEARCH_CACHE_MAX = 1024
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_get(engine: str, query: str, num_results: int):
+    """Return fresh cached results for an engine query, or None."""
+    key = (engine, query.lower().strip(), num_results)
+    with _search_cache_lock:
+        entry = _SEARCH_CACHE.get(key)
+        if entry and time.time() - entry[0] < _SEARCH_CACHE_TTL:
+            return list(entry[1])
+        if entry:
+            del _SEARCH_CACHE[key]
+    return None
+
+
+def _search_cache_put(
+    engine: str, query: str, num_results: int, results: List[Dict[str, Any]]
+) -> None:
+    """Store engine results; evicts the oldest entry when full."""
+    key = (engine, query.lower().strip(), num_results)
+    with _search_cache_lock:
+        if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX:
+            oldest = min(_SEARCH_CACHE, key=lambda k: _SEARCH_CACHE[k][0])
+            del _SEARCH_CACHE[oldest]
+        _SEARCH_CACHE[key] = (time.time(), results)
+
+
+# ---------------------------------------------------------------------------
+# Dedup key hashing — xxh3 is several times faster than Python's SipHash
+# for short strings; membership sets store the integer digest instead of
+# the string itself. Falls back to the built-in hash when unavailable.
+# ---------------------------------------------------------------------------
+if xxhash is not None:
+    def hash_key(s: str) -> int:
+        """Return a 64-bit xxh3 digest of *s* for use as a dedup key."""
+        return xxhash.xxh3_64_intdigest(s.encode("utf-8"))
+else:
+    def hash_key(s: str) -> int:
+        """Return the built-in hash of *s* (xxhash not installed)."""
+        return hash(s)
+
 # ---------------------------------------------------------------------------
-# Rate-limiting helper
+# Rate-limiting helpers
 # ---------------------------------------------------------------------------
-_last_call_ts: Dict[str, float] = {"serpapi": 0.0, "ddg": 0.0}
+# Next allowed send time per engine; callers reserve a slot under the lock
+# so concurrent threads/tasks queue up instead of racing past the floor.
+_next_slot_ts: Dict[str, float] = {"serpapi": 0.0, "ddg": 0.0}
 _MIN_INTERVAL = 1.5  # seconds between requests to the same engine
+_rate_lock = threading.Lock()
+
+
+def _reserve_slot(engine: str) -> float:
+    """Reserve the next send slot for *engine*; returns seconds to wait."""
+    with _rate_lock:
+        now = time.time()
+        slot = max(now, _next_slot_ts.get(engine, 0.0) + _MIN_INTERVAL)
+        _next_slot_ts[engine] = slot
+        return slot - now
 
 
 def _rate_limit(engine: str) -> None:
-    """Block until the minimum interval has elapsed for *engine*."""
-    elapsed = time.time() - _last_call_ts.get(engine, 0.0)
-    if elapsed < _MIN_INTERVAL:
-        time.sleep(_MIN_INTERVAL - elapsed)
-    _last_call_ts[engine] = time.time()
+    """Block until the minimum interval has elapsed for *engine*.
+
+    Thread-safe: each caller reserves its own slot, so parallel callers
+    are spaced _MIN_INTERVAL apart rather than all skipping the sleep.
+    """
+    delay = _reserve_slot(engine)
+    if delay > 0:
+        time.sleep(delay)
+
+
+async def _arate_limit(engine: str) -> None:
+    """Async variant of :func:`_rate_limit` — never blocks the event loop."""
+    delay = _reserve_slot(engine)
+    if delay > 0:
+        await asyncio.sleep(delay)
 
 
 # ---------------------------------------------------------------------------
@@ -52,6 +167,11 @@ def serpapi_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]:
         logger.error("SERPAPI_API_KEY / SERPAPI_KEY not set in environment")
         return []
 
+    cached = _search_cache_get("serpapi", query, num_results)
+    if cached is not None:
+        logger.info("SerpAPI cache hit for: %s", query)
+        return cached
+
     _rate_limit("serpapi")
     logger.info("SerpAPI search – query: %s", query)
 
@@ -62,24 +182,24 @@ def serpapi_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]:
             "api_key": api_key,
             "num": num_results,
         }
-        response = requests.get(
+        response = _SESSION.get(
             "https://serpapi.com/search", params=params, timeout=30
         )
         response.raise_for_status()
         data = response.json()
 
-        results: List[Dict[str, Any]] = []
-        for item in data.get("organic_results", []):
-            results.append(
-                {
-                    "title": item.get("title", ""),
-                    "link": item.get("link", ""),
-                    "snippet": item.get("snippet", ""),
-                    "source_engine": "serpapi",
-                }
-            )
+        results: List[Dict[str, Any]] = [
+            {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet", ""),
+                "source_engine": "serpapi",
+            }
+            for item in data.get("organic_results", [])
+        ]
 
         logger.info("SerpAPI returned %d results for: %s", len(results), query)
+        _search_cache_put("serpapi", query, num_results, results)
         return results
 
     except requests.RequestException as exc:
@@ -104,25 +224,29 @@ def duckduckgo_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]
     Returns:
         List of dicts with keys: title, link, snippet, source_engine.
     """
+    cached = _search_cache_get("duckduckgo", query, num_results)
+    if cached is not None:
+        logger.info("DuckDuckGo cache hit for: %s", query)
+        return cached
+
     _rate_limit("ddg")
     logger.info("DuckDuckGo search – query: %s", query)
 
     try:
-        with DDGS() as ddgs:
-            raw = list(ddgs.text(query, max_results=num_results))
-
-        results: List[Dict[str, Any]] = []
-        for item in raw:
-            results.append(
-                {
-                    "title": item.get("title", ""),
-                    "link": item.get("href", ""),
-                    "snippet": item.get("body", ""),
-                    "source_engine": "duckduckgo",
-                }
-            )
+        raw = list(_get_ddgs().text(query, max_results=num_results))
+
+        results: List[Dict[str, Any]] = [
+            {
+                "title": item.get("title", ""),
+                "link": item.get("href", ""),
+                "snippet": item.get("body", ""),
+                "source_engine": "duckduckgo",
+            }
+            for item in raw
+        ]
 
         logger.info("DuckDuckGo returned %d results for: %s", len(results), query)
+        _search_cache_put("duckduckgo", query, num_results, results)
         return results
 
     except Exception as exc:  # DDGS may raise various exceptions
@@ -130,6 +254,179 @@ def duckduckgo_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]
         return []
 
 
+def combined_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]:
+    """Query both engines concurrently and return merged, deduplicated results.
+
+    Convenience for synchronous callers running a single query: the two
+    engine calls are independent I/O, so two threads overlap them instead
+    of waiting on each in turn.
+
+    Args:
+        query: Search query string.
+        num_results: Maximum results per engine.
+
+    Returns:
+        Deduplicated list of search results from both engines.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        serp_future = executor.submit(serpapi_search, query, num_results)
+        ddg_future = executor.submit(duckduckgo_search, query, num_results)
+        return merge_and_deduplicate(serp_future.result(), ddg_future.result())
+
+
+# ---------------------------------------------------------------------------
+# Async search fan-out
+# ---------------------------------------------------------------------------
+# Cap on simultaneous in-flight requests across both engines (rate limits).
+_MAX_CONCURRENT_SEARCHES = 8
+
+
+async def serpapi_search_async(
+    session: aiohttp.ClientSession, query: str, num_results: int = 10
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`serpapi_search` using a shared aiohttp session.
+
+    Args:
+        session: Shared aiohttp ClientSession (connection pooling / TLS reuse).
+        query: Search query string.
+        num_results: Maximum number of results to return.
+
+    Returns:
+        List of dicts with keys: title, link, snippet, source_engine.
+    """
+    api_key = os.getenv("SERPAPI_API_KEY", "") or os.getenv("SERPAPI_KEY", "")
+    if not api_key:
+        logger.error("SERPAPI_API_KEY / SERPAPI_KEY not set in environment")
+        return []
+
+    cached = _search_cache_get("serpapi", query, num_results)
+    if cached is not None:
+        logger.info("SerpAPI cache hit for: %s", query)
+        return cached
+
+    await _arate_limit("serpapi")
+    logger.info("SerpAPI search (async) – query: %s", query)
+
+    try:
+        params = {
+            "engine": "google",
+            "q": query,
+            "api_key": api_key,
+            "num": num_results,
+        }
+        async with session.get(
+            "https://serpapi.com/search",
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        results: List[Dict[str, Any]] = [
+            {
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet", ""),
+                "source_engine": "serpapi",
+            }
+            for item in data.get("organic_results", [])
+        ]
+
+        logger.info("SerpAPI returned %d results for: %s", len(results), query)
+        _search_cache_put("serpapi", query, num_results, results)
+        return results
+
+    except aiohttp.ClientError as exc:
+        logger.error("SerpAPI request failed: %s", exc)
+        return []
+    except (KeyError, ValueError) as exc:
+        logger.error("SerpAPI response parsing error: %s", exc)
+        return []
+
+
+async def duckduckgo_search_async(
+    query: str, num_results: int = 10
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`duckduckgo_search`.
+
+    DDGS only exposes a blocking client, so the sync call is pushed onto a
+    worker thread; the event loop stays free to overlap other requests.
+
+    Args:
+        query: Search query string.
+        num_results: Maximum number of results to return.
+
+    Returns:
+        List of dicts with keys: title, link, snippet, source_engine.
+    """
+    return await asyncio.to_thread(duckduckgo_search, query, num_results)
+
+
+async def _run_searches_async(
+    queries: List[str], num_results: int = 5
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Fan out both engines over all queries with asyncio.gather.
+
+    One task is created per (query, engine) pair; all tasks share a single
+    aiohttp session and are bounded by a semaphore so the engines are not
+    hammered beyond their rate limits.
+
+    Args:
+        queries: Search query strings.
+        num_results: Maximum results per (query, engine) pair.
+
+    Returns:
+        Tuple of (serp_results, ddg_results) aggregated across all queries.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    async with aiohttp.ClientSession() as session:
+        serp_tasks = [
+            _bounded(serpapi_search_async(session, q, num_results)) for q in queries
+        ]
+        ddg_tasks = [
+            _bounded(duckduckgo_search_async(q, num_results)) for q in queries
+        ]
+        outcomes = await asyncio.gather(
+            *serp_tasks, *ddg_tasks, return_exceptions=True
+        )
+
+    all_serp: List[Dict[str, Any]] = []
+    all_ddg: List[Dict[str, Any]] = []
+    for i, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Search task failed: %s", outcome)
+            continue
+        if i < len(queries):
+            all_serp.extend(outcome)
+        else:
+            all_ddg.extend(outcome)
+
+    return all_serp, all_ddg
+
+
+def run_searches(
+    queries: List[str], num_results: int = 5
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Run SerpAPI + DuckDuckGo over all queries concurrently.
+
+    Synchronous entry point for callers that are not already inside an
+    event loop (e.g. LangGraph nodes).
+
+    Args:
+        queries: Search query strings.
+        num_results: Maximum results per (query, engine) pair.
+
+    Returns:
+        Tuple of (serp_results, ddg_results) aggregated across all queries.
+    """
+    return asyncio.run(_run_searches_async(queries, num_results))
+
+
 # ---------------------------------------------------------------------------
 # Merge & Deduplicate
 # ---------------------------------------------------------------------------
@@ -147,14 +444,13 @@ def merge_and_deduplicate(
     Returns:
         Deduplicated list of search results.
     """
-    seen_urls: set = set()
-    merged: List[Dict[str, Any]] = []
-
-    for item in serp_results + ddg_results:
+    # One insertion-ordered dict does dedup and ordering in a single pass
+    merged_by_url: Dict[int, Dict[str, Any]] = {}
+    for item in itertools.chain(serp_results, ddg_results):
         url = item.get("link", "").rstrip("/").lower()
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            merged.append(item)
+        if url:
+            merged_by_url.setdefault(hash_key(url), item)
+    merged = list(merged_by_url.values())
 
     logger.info(
         "Merged results: %d (SerpAPI=%d, DDG=%d, after dedup=%d)",
@@ -170,11 +466,24 @@ def merge_and_deduplicate(
 # Page scraper (used by Validator agent) — powered by ContentScraper
 # ---------------------------------------------------------------------------
 
+def _canonicalize_url(url: str) -> str:
+    """Normalize a URL for cache keying: lowercase scheme/host, no fragment."""
+    try:
+        parts = urlparse(url)
+        return urlunparse(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.params, parts.query, "")
+        )
+    except ValueError:
+        return url
+
+
 def scrape_page(url: str, max_chars: int = 5000) -> str:
     """Scrape and return visible text from a URL using ContentScraper.
 
     Uses requests + BeautifulSoup first, falls back to Selenium for
     dynamic/JS-heavy pages, and applies readability-based extraction.
+    Results are memoized per canonicalized URL so retries of the graph
+    (refined queries often resurface the same links) skip the refetch.
 
     Args:
         url: Web page URL.
@@ -183,11 +492,79 @@ def scrape_page(url: str, max_chars: int = 5000) -> str:
     Returns:
         Cleaned page text or empty string on failure.
     """
+    return _scrape_page_cached(_canonicalize_url(url), max_chars)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_scraper():
+    """Lazily construct the process-wide ContentScraper.
+
+    Reusing one instance keeps its requests Session (pooled connections)
+    and any Selenium driver alive across calls instead of paying Chrome
+    startup per URL; atexit tears the driver down on interpreter exit.
+    """
     from src.tools.scraper import ContentScraper
 
+    scraper = ContentScraper(headless=True, wait_time=10)
+    atexit.register(scraper._close_driver)
+    return scraper
+
+
+@functools.lru_cache(maxsize=1)
+def _scrape_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared worker pool for page scrapes.
+
+    ``asyncio.to_thread`` would spin up a fresh default executor for every
+    ``asyncio.run`` loop; one persistent pool avoids that thread churn and
+    caps how hard we hit remote hosts.
+    """
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=8, thread_name_prefix="scrape"
+    )
+
+
+async def _scrape_pages_async(urls: List[str], max_chars: int) -> List[str]:
+    """Gather :func:`scrape_page` calls on the shared worker pool.
+
+    The underlying scraper is synchronous (requests/Selenium have no native
+    async API), so each call runs on a pool thread; the pool size bounds
+    concurrency.
+    """
+    loop = asyncio.get_running_loop()
+    outcomes = await asyncio.gather(
+        *(
+            loop.run_in_executor(_scrape_pool(), scrape_page, u, max_chars)
+            for u in urls
+        ),
+        return_exceptions=True,
+    )
+    return ["" if isinstance(o, Exception) else o for o in outcomes]
+
+
+def scrape_pages(urls: List[str], max_chars: int = 5000) -> Dict[str, str]:
+    """Scrape several URLs concurrently and map each URL to its text.
+
+    All fetches overlap, so total latency is the slowest page rather than
+    the sum. Failures yield empty strings; the per-URL memoization of
+    :func:`scrape_page` still applies.
+
+    Args:
+        urls: Web page URLs.
+        max_chars: Maximum characters to return per page.
+
+    Returns:
+        Dict of url -> cleaned page text (empty string on failure).
+    """
+    if not urls:
+        return {}
+    return dict(zip(urls, asyncio.run(_scrape_pages_async(urls, max_chars))))
+
+
+@functools.lru_cache(maxsize=256)
+def _scrape_page_cached(url: str, max_chars: int) -> str:
+    """Memoized body of :func:`scrape_page`."""
     try:
-        scraper = ContentScraper(headless=True, wait_time=10)
-        result = scraper.scrape_content(url)
+        result = _shared_scraper().scrape_content(url)
         text = result.get("text", "")
         return text[:max_chars] if text else ""
     except Exception as exc:
@@ -1,16 +1,135 @@
 """
 Logger configuration for PersonFinderTool.
 Writes structured logs to logs/app.log.
+
+Prefer %-style arguments (``logger.info("x=%s", value)``) so formatting
+is deferred until a handler accepts the record. For messages whose
+*construction* is expensive (json.dumps of a payload, joining large
+lists), wrap the work in :func:`debug_lazy` so it only runs when DEBUG
+is actually enabled.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
+
+try:
+    import orjson  # optional fast JSON serializer
+except ImportError:
+    orjson = None
+
+# Stream buffer size for the log file; small frequent records are
+# coalesced into one write() syscall per buffer instead of one per line.
+_LOG_BUFFER_BYTES = 65536
+
+# Seconds between background flushes of the buffered log stream
+_FLUSH_INTERVAL = 2.0
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per epoch second.
+
+    strftime + localtime are comparatively slow C calls that plain
+    Formatter repeats for every record; bursts of records within the same
+    second reuse the cached string instead.
+    """
+
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        self._last_sec = -1
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(
+                datefmt or self.default_time_format, time.localtime(sec)
+            )
+            self._last_sec = sec
+        return self._last_str
+
+
+class _JsonFormatter(_CachedTimeFormatter):
+    """Render each record as one JSON object per line.
+
+    Newline-delimited JSON lets log aggregators index fields directly
+    instead of regex-parsing the pipe-delimited text; the console keeps
+    the human-readable format.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(payload).decode()
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers writes and flushes on a timer.
+
+    Plain FileHandler flushes after every record. This variant keeps a
+    64 KB stream buffer, flushes immediately only for ERROR and above,
+    and otherwise lets a daemon timer flush every couple of seconds.
+    """
+
+    def __init__(self, filename: str, mode: str = "a", encoding: str = None):
+        super().__init__(filename, mode, encoding=encoding)
+        atexit.register(self.flush)
+        self._schedule_flush()
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode,
+            buffering=_LOG_BUFFER_BYTES, encoding=self.encoding,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # StreamHandler.emit flushes per record; skip that unless the
+        # record is urgent enough to need to hit disk right away.
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def _schedule_flush(self) -> None:
+        timer = threading.Timer(_FLUSH_INTERVAL, self._flush_and_reschedule)
+        timer.daemon = True
+        timer.start()
+        self._timer = timer
+
+    def _flush_and_reschedule(self) -> None:
+        self.flush()
+        self._schedule_flush()
+
+    def close(self) -> None:
+        self._timer.cancel()
+        super().close()
 
 
 def setup_logger(name: str = "person_finder", level: int = logging.INFO) -> logging.Logger:
     """Set up and return a configured logger instance.
 
+    Handlers are driven through a QueueHandler/QueueListener pair, so a
+    log call on the request path is an in-memory queue append; the actual
+    file and console writes happen on the listener thread.
+
     Args:
         name: Logger name identifier.
         level: Logging level (default: INFO).
@@ -18,6 +137,11 @@ def setup_logger(name: str = "person_finder", level: int = logging.INFO) -> logg
     Returns:
         Configured logging.Logger instance.
     """
+    # Fast path once configured: repeat calls (worker threads, re-imports)
+    # become a plain registry lookup with no makedirs/handler work.
+    if getattr(setup_logger, "_done", False):
+        return logging.getLogger(name)
+
     log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "logs")
     os.makedirs(log_dir, exist_ok=True)
 
@@ -25,29 +149,55 @@ def setup_logger(name: str = "person_finder", level: int = logging.INFO) -> logg
     logger.setLevel(level)
 
     if not logger.handlers:
-        # File handler — detailed logs
-        file_handler = logging.FileHandler(
+        # File handler — detailed logs, buffered
+        file_handler = _BufferedFileHandler(
             os.path.join(log_dir, "app.log"), encoding="utf-8"
         )
         file_handler.setLevel(level)
-        file_formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        # No funcName/lineno: resolving them forces a sys._getframe walk
+        # per record, and _srcfile=None below disables that lookup anyway
+        file_formatter = _JsonFormatter(datefmt="%Y-%m-%d %H:%M:%S")
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
 
         # Console handler — concise logs
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.WARNING)
-        console_formatter = logging.Formatter(
+        console_formatter = _CachedTimeFormatter(
             "%(asctime)s | %(levelname)-8s | %(message)s",
             datefmt="%H:%M:%S",
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
 
+        # Callers only enqueue; the listener thread owns the real handlers
+        log_queue: queue.Queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+    # Short-circuit Logger.findCaller so no record pays the frame walk
+    logging._srcfile = None  # type: ignore[attr-defined]
+
+    setup_logger._done = True  # type: ignore[attr-defined]
     return logger
 
 
+def debug_lazy(log: logging.Logger, factory, *args) -> None:
+    """Log a DEBUG message whose construction is deferred.
+
+    ``factory(*args)`` builds the message string and is only invoked when
+    the logger has DEBUG enabled, so expensive serialization never runs
+    on the normal INFO-level path.
+
+    Args:
+        log: Target logger.
+        factory: Zero-or-more-argument callable returning the message.
+        *args: Arguments forwarded to ``factory``.
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(factory(*args))
+
+
 logger = setup_logger()
\ No newline at end of file
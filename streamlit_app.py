@@ -8,6 +8,48 @@ Run with:
 import json
 import streamlit as st
 
+# Imported at module scope so the heavy LangChain/LangGraph import chain
+# loads during the initial script run, not on the first button press
+from src.main import find_person
+
+
+class _UncachedError(Exception):
+    """Carries an error payload out of the cached wrapper without caching it."""
+
+    def __init__(self, result):
+        super().__init__(result.get("error", ""))
+        self.result = result
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_find_person(company: str, designation: str):
+    """Run find_person with results cached per (company, designation).
+
+    Re-submitting the same pair (or reverting a tweak) returns instantly
+    and spends no search/LLM quota. Inputs are stripped before keying so
+    stray whitespace doesn't miss the cache. Error payloads are raised
+    instead of returned so a transient failure is never pinned for the
+    TTL — the next submit retries for real.
+    """
+    result = find_person(company, designation)
+    if "error" in result:
+        raise _UncachedError(result)
+    return result
+
+try:
+    import orjson  # optional fast JSON serializer
+except ImportError:
+    orjson = None
+
+
+def _dumps_pretty(data) -> str:
+    """Serialize a result dict to indented JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
+    return json.dumps(data, indent=2, sort_keys=True)
+
 # ---------------------------------------------------------------------------
 # Page configuration
 # ---------------------------------------------------------------------------
@@ -58,9 +100,9 @@ if submitted:
     else:
         with st.spinner("Searching and cross-validating across multiple sources…"):
             try:
-                from src.main import find_person
-
-                result = find_person(company.strip(), designation.strip())
+                result = _cached_find_person(company.strip(), designation.strip())
+            except _UncachedError as exc:
+                result = exc.result
             except Exception as exc:
                 st.error(f"An unexpected error occurred: {exc}")
                 result = None
@@ -99,7 +141,7 @@ if submitted:
 
                 # Raw JSON expander
                 with st.expander("📋 Raw JSON Output"):
-                    st.code(json.dumps(result, indent=2), language="json")
+                    st.code(_dumps_pretty(result), language="json")
 
 # ---------------------------------------------------------------------------
 # Footer